@@ -21,25 +21,85 @@ Examples::
     # Do a liftover from GRCh38 to CHM13 of the human INS gene
     # along with 5 kb upstream and downstream flanking regions.
     python hal_gene_liftover.py --src-region chr11:2159779-2161221:-1 \
-        --flank 5000 input.hal GRCh38 CHM13 output.psl
+        --flank 5000 input.hal GRCh38 CHM13 output.chain
 
     # Do a liftover from GRCh38 to CHM13 of the
     # features specified in an input BED file.
     python hal_gene_liftover.py --src-bed-file input.bed \
-        --flank 5000 input.hal GRCh38 CHM13 output.psl
+        --flank 5000 input.hal GRCh38 CHM13 output.chain
 
 """
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+import fcntl
+from functools import partial
+import hashlib
+import io
+from itertools import repeat
+import json
 import os
 from pathlib import Path
-import re
-from subprocess import PIPE, Popen, run
+import shutil
+from subprocess import CalledProcessError, PIPE, Popen
 from tempfile import TemporaryDirectory
-from typing import Dict, Iterable, Mapping, NamedTuple, Union
+import threading
+from typing import (BinaryIO, Callable, Dict, Iterable, List, Mapping, MutableSequence,
+                    NamedTuple, TextIO, Union)
 
+import numpy as np
+import pandas as pd
 import pybedtools  # type: ignore
 
+try:
+    import py2bit  # type: ignore
+except ImportError:
+    py2bit = None
+
+
+# Buffer size used for the pipes between child processes, chosen to
+# coalesce reads/writes of the multi-gigabyte FASTA and PSL streams.
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Map of the strand values accepted in a region string to BED strand symbols.
+_STRAND_SYMBOLS = {'1': '+', '-1': '-'}
+
+
+def _enlarge_pipe_buffer(pipe_f: Union[BinaryIO, TextIO]) -> None:
+    """Enlarge the kernel buffer of a pipe to `PIPE_BUFFER_SIZE`.
+
+    A larger kernel buffer means fewer producer/consumer wakeups on
+    high-throughput pipes. This is best effort: the pipe keeps its default
+    size where F_SETPIPE_SZ is unavailable (e.g. non-Linux platforms) or
+    the requested size exceeds the unprivileged pipe size limit.
+
+    Args:
+        pipe_f: File object wrapping one end of the pipe.
+
+    """
+    if hasattr(fcntl, 'F_SETPIPE_SZ'):
+        try:
+            fcntl.fcntl(pipe_f.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+        except OSError:
+            pass
+
+
+def _check_process_status(process_name: str, returncode: int) -> None:
+    """Raise a RuntimeError if a child process has nonzero exit status.
+
+    Args:
+        process_name: Name of the child process.
+        returncode: Return code of the child process.
+
+    Raises:
+        RuntimeError: If `returncode` is nonzero.
+
+    """
+    if returncode != 0:
+        status_type = 'exit code' if returncode > 0 else 'signal'
+        raise RuntimeError(f'{process_name} terminated with {status_type} {abs(returncode)}')
+
 
 class SimpleRegion(NamedTuple):
     """A simple region."""
@@ -49,38 +109,201 @@ class SimpleRegion(NamedTuple):
     strand: str
 
 
-def load_chr_sizes(hal_file: Union[Path, str], genome_name: str) -> Dict[str, int]:
-    """Load chromosome sizes from an input HAL file.
+def export_2bit_file(hal_file: Union[Path, str], genome_name: str,
+                     two_bit_file: Union[Path, str]) -> None:
+    """Export a genome from a HAL file to a 2bit file.
 
     Args:
         hal_file: Input HAL file.
-        genome_name: Name of the genome to get the chromosome sizes of.
+        genome_name: Name of the genome to export.
+        two_bit_file: Path of 2bit file to output.
+
+    Raises:
+        RuntimeError: If hal2fasta or faToTwoBit has nonzero exit status.
+
+    """
+    # hal2fasta in.hal GRCh38 | faToTwoBit stdin out.2bit
+    cmd1 = ['hal2fasta', hal_file, genome_name]
+    cmd2 = ['faToTwoBit', 'stdin', two_bit_file]
+    with Popen(cmd1, stdout=PIPE, bufsize=PIPE_BUFFER_SIZE) as p1:
+        _enlarge_pipe_buffer(p1.stdout)  # type: ignore[arg-type]
+        with Popen(cmd2, stdin=p1.stdout, bufsize=PIPE_BUFFER_SIZE) as p2:
+            p2.wait()
+            _check_process_status('faToTwoBit', p2.returncode)
+        p1.wait()
+        _check_process_status('hal2fasta', p1.returncode)
+
+
+def fetch_2bit_file(hal_file: Union[Path, str], genome_name: str,
+                    aux_dir: Union[Path, str]) -> str:
+    """Fetch a 2bit file for the given genome, exporting it from the HAL file if necessary.
+
+    Exported 2bit files are cached in `aux_dir` under a name keyed on the
+    genome name and the modification time of the HAL file, so the export is
+    skipped whenever a 2bit file matching the current HAL file already
+    exists, and a stale 2bit file is never reused after the HAL file has
+    been updated in place. A lock file serialises concurrent exports of the
+    same genome, and the 2bit file is moved into place atomically, so
+    concurrent invocations sharing `aux_dir` do not race on the same path.
+
+    Args:
+        hal_file: Input HAL file.
+        genome_name: Name of the genome to fetch the 2bit file of.
+        aux_dir: Directory in which exported 2bit files are cached.
+
+    Returns:
+        Path of the cached 2bit file.
+
+    """
+    hal_mtime = os.stat(hal_file).st_mtime_ns
+    key = hashlib.blake2b(f'{hal_mtime}:{genome_name}'.encode()).hexdigest()[:16]
+    two_bit_file = os.path.join(aux_dir, f'{genome_name}.{key}.2bit')
+
+    if not os.path.isfile(two_bit_file):
+        with open(f'{two_bit_file}.lock', 'w') as lock_f:
+            fcntl.flock(lock_f, fcntl.LOCK_EX)
+            # Another invocation may have done the export while we waited on the lock.
+            if not os.path.isfile(two_bit_file):
+                tmp_two_bit_file = f'{two_bit_file}.tmp'
+                export_2bit_file(hal_file, genome_name, tmp_two_bit_file)
+                os.replace(tmp_two_bit_file, two_bit_file)
+
+    return two_bit_file
+
+
+def load_chrom_sizes(two_bit_file: Union[Path, str]) -> Dict[str, int]:
+    """Load chromosome sizes from an input 2bit file.
+
+    The sizes are read directly from the 2bit index via py2bit where that
+    library is available, and otherwise by parsing twoBitInfo output. The
+    result is cached in a JSON file alongside the 2bit file, so repeated
+    runs against the same 2bit file load the sizes from the cache instead;
+    the cache is ignored if it is older than the 2bit file, and caching is
+    skipped quietly where the directory is not writable.
+
+    Args:
+        two_bit_file: Input 2bit file.
 
     Returns:
         Dictionary mapping chromosome names to their lengths.
 
+    Raises:
+        CalledProcessError: If twoBitInfo has nonzero exit status.
+
     """
-    cmd = ['halStats', '--chromSizes', genome_name, hal_file]
-    process = run(cmd, check=True, capture_output=True, text=True, encoding='ascii')
+    sizes_file = Path(f'{two_bit_file}.sizes.json')
+    try:
+        if sizes_file.stat().st_mtime >= os.stat(two_bit_file).st_mtime:
+            return json.loads(sizes_file.read_text())
+    except (OSError, ValueError):
+        pass  # missing or unreadable cache file, so compute the sizes below
+
+    chrom_sizes = _read_chrom_sizes(two_bit_file)
+
+    try:
+        tmp_sizes_file = f'{sizes_file}.tmp'
+        with open(tmp_sizes_file, 'w') as f:
+            json.dump(chrom_sizes, f)
+        os.replace(tmp_sizes_file, sizes_file)
+    except OSError:
+        pass
 
-    chr_sizes = {}
-    for line in process.stdout.splitlines():
-        chr_name, chr_size = line.rstrip().split('\t')
-        chr_sizes[chr_name] = int(chr_size)
+    return chrom_sizes
+
+
+def _read_chrom_sizes(two_bit_file: Union[Path, str]) -> Dict[str, int]:
+    """Read chromosome sizes from an input 2bit file.
+
+    Args:
+        two_bit_file: Input 2bit file.
+
+    Returns:
+        Dictionary mapping chromosome names to their lengths.
+
+    Raises:
+        CalledProcessError: If twoBitInfo has nonzero exit status.
+
+    """
+    if py2bit is not None:
+        # pylint: disable-next=c-extension-no-member
+        tb = py2bit.open(str(two_bit_file))
+        try:
+            return dict(tb.chroms())
+        finally:
+            tb.close()
+
+    cmd = ['twoBitInfo', two_bit_file, 'stdout']
+    with Popen(cmd, stdout=PIPE, bufsize=-1, text=True, encoding='ascii') as process:
+        try:
+            df = pd.read_csv(process.stdout, sep='\t', header=None, names=['chrom', 'size'],
+                             dtype={'chrom': str, 'size': np.int64})
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame(columns=['chrom', 'size'])
+        process.wait()
+        if process.returncode != 0:
+            raise CalledProcessError(process.returncode, cmd)
+
+    # tolist() yields plain Python ints, which keeps the result JSON-serializable
+    return dict(zip(df['chrom'], df['size'].tolist()))
+
+
+def _flank_and_validate(chr_sizes: Mapping[str, int],
+                        flank_length: int) -> Callable:
+    """Make a function that validates an interval and applies flanking regions in place.
+
+    The returned function is suitable for passing to
+    :meth:`pybedtools.BedTool.each`, so intervals are transformed one at a
+    time as they stream through to the output file.
+
+    Args:
+        chr_sizes: Mapping of chromosome names to their lengths.
+        flank_length: Length of upstream/downstream flanking regions to request.
+
+    Returns:
+        Function transforming a single :class:`pybedtools.cbedtools.Interval`.
+
+    """
+    # pylint: disable-next=c-extension-no-member
+    def apply_to_interval(interval: pybedtools.cbedtools.Interval) -> pybedtools.cbedtools.Interval:
 
-    return chr_sizes
+        try:
+            chr_size = chr_sizes[interval.chrom]
+        except KeyError as e:
+            raise ValueError(
+                f"chromosome ID not found in input file: '{interval.chrom}'") from e
+
+        start = interval.start
+        end = interval.end
+
+        if start < 0:
+            raise ValueError(f'region start must be greater than or equal to 0: {start}')
+
+        if end > chr_size:
+            raise ValueError(f'region end ({end}) must not be greater than the'
+                             f' corresponding chromosome length ({interval.chrom}: {chr_size})')
+
+        flanked_start = max(0, start - flank_length)
+        flanked_end = min(end + flank_length, chr_size)
+
+        # A fresh BED6 interval is returned so the output is uniform
+        # whatever the input interval width (halLiftover requires an
+        # integer score in BED input).
+        return pybedtools.create_interval_from_list(
+            [interval.chrom, str(flanked_start), str(flanked_end), '.', '0', interval.strand])
+
+    return apply_to_interval
 
 
 # pylint: disable-next=c-extension-no-member
 def make_src_region_file(regions: Iterable[Union[pybedtools.cbedtools.Interval, SimpleRegion]],
-                         chr_sizes: Mapping[str, int], bed_file: Union[Path, str],
+                         chr_sizes: Mapping[str, int], bed_file: Union[Path, str, TextIO],
                          flank_length: int = 0) -> None:
     """Make source region file.
 
     Args:
         regions: Regions to write to output file.
         chr_sizes: Mapping of chromosome names to their lengths.
-        bed_file: Path of BED file to output.
+        bed_file: Path of BED file to output, or a writable text stream.
         flank_length: Length of upstream/downstream flanking regions to request.
 
     Raises:
@@ -91,28 +314,300 @@ def make_src_region_file(regions: Iterable[Union[pybedtools.cbedtools.Interval,
     if flank_length < 0:
         raise ValueError(f"'flank_length' must be greater than or equal to 0: {flank_length}")
 
-    with open(bed_file, 'w') as f:
-        name = '.'
-        score = 0  # halLiftover requires an integer score in BED input
-        for region in regions:
+    if isinstance(regions, pybedtools.BedTool):
+        # Transform intervals one at a time as they stream through to the
+        # output, rather than materializing the whole BED in memory.
+        flanked_regions = regions.each(_flank_and_validate(chr_sizes, flank_length))
+        if hasattr(bed_file, 'write'):
+            for interval in flanked_regions:
+                bed_file.write(str(interval))  # type: ignore[union-attr]
+        else:
+            flanked_regions.saveas(bed_file)
+        return
+
+    # Regions are normalized via attribute access, so any iterable of
+    # interval-like objects (e.g. pybedtools Intervals) is accepted, not
+    # just SimpleRegion tuples.
+    df = pd.DataFrame(
+        [(region.chrom, region.start, region.end, region.strand) for region in regions],
+        columns=['chrom', 'start', 'end', 'strand'])
+
+    # Coordinates fit in int32 for all but the most extreme assemblies,
+    # halving the memory footprint of the flanked coordinate columns.
+    if max(chr_sizes.values(), default=0) <= np.iinfo(np.int32).max:
+        coord_dtype: type = np.int32
+    else:
+        coord_dtype = np.int64
+
+    sizes = df['chrom'].map(chr_sizes)
+
+    unknown_chrom = sizes.isna().to_numpy()
+    if unknown_chrom.any():
+        chrom = df['chrom'].iloc[np.argmax(unknown_chrom)]
+        raise ValueError(f"chromosome ID not found in input file: '{chrom}'")
+    sizes = sizes.to_numpy(dtype=np.int64)
+
+    # Validation is done on the native int64 values: narrowing first would
+    # silently wrap out-of-range coordinates and let them pass the checks.
+    starts = df['start'].to_numpy(dtype=np.int64)
+    bad_start = starts < 0
+    if bad_start.any():
+        raise ValueError(f'region start must be greater than or equal to 0:'
+                         f' {starts[np.argmax(bad_start)]}')
+
+    ends = df['end'].to_numpy(dtype=np.int64)
+    bad_end = ends > sizes
+    if bad_end.any():
+        idx = np.argmax(bad_end)
+        raise ValueError(f'region end ({ends[idx]}) must not be greater than the'
+                         f' corresponding chromosome length ({df["chrom"].iloc[idx]}: {sizes[idx]})')
+
+    df['start'] = np.maximum(0, starts - flank_length)
+    df['end'] = np.minimum(ends + flank_length, sizes)
+
+    # Flanked ends are bounded by the chromosome sizes and flanked starts
+    # by the validated input starts, so this narrowing cannot wrap.
+    if starts.max(initial=0) <= np.iinfo(coord_dtype).max:
+        df['start'] = df['start'].astype(coord_dtype)
+        df['end'] = df['end'].astype(coord_dtype)
+    df['name'] = '.'
+    df['score'] = 0  # halLiftover requires an integer score in BED input
+
+    df.to_csv(bed_file, sep='\t', header=False, index=False,
+              columns=['chrom', 'start', 'end', 'name', 'score', 'strand'])
+
+
+def _feed_src_regions(write_src_regions: Callable[[TextIO], None], pipe_f: BinaryIO,
+                      errors: MutableSequence[BaseException]) -> None:
+    """Write query BED regions into a pipe.
+
+    Intended to run in a writer thread while another process reads the
+    pipe. The pipe is closed on completion or failure, so the reader sees
+    end-of-file rather than hanging if a region fails validation; any
+    exception raised is recorded in `errors` for the main thread to
+    re-raise.
+
+    Args:
+        write_src_regions: Callable writing the query BED regions to a given text stream.
+        pipe_f: Binary stream wrapping the write end of the pipe.
+        errors: Sequence in which to record any exception raised.
+
+    """
+    try:
+        with io.TextIOWrapper(pipe_f, encoding='ascii') as pipe_text_f:
+            write_src_regions(pipe_text_f)
+    except BrokenPipeError:
+        pass  # the reader exited early; its exit status is reported separately
+    except BaseException as e:  # pylint: disable=broad-except
+        errors.append(e)
 
+
+def _split_bed(in_bed_file: Union[Path, str], num_chunks: int,
+               tmp_dir: Union[Path, str]) -> List[str]:
+    """Split a BED file into chunks of approximately equal size.
+
+    Lines are distributed round-robin, so each chunk gets a similar share
+    of the regions regardless of how the input file is sorted.
+
+    Args:
+        in_bed_file: Input BED file.
+        num_chunks: Maximum number of chunks to create.
+        tmp_dir: Directory in which chunk BED files are created.
+
+    Returns:
+        List of the chunk BED file paths that were created. Chunks that
+        would be empty are not created, so fewer than `num_chunks` paths
+        may be returned.
+
+    """
+    chunk_bed_files = [os.path.join(tmp_dir, f'chunk_{i}.bed') for i in range(num_chunks)]
+    chunk_line_counts = [0] * num_chunks
+    with open(in_bed_file) as in_f, ExitStack() as stack:
+        chunk_files = [stack.enter_context(open(chunk_bed_file, 'w'))
+                       for chunk_bed_file in chunk_bed_files]
+        for line_num, line in enumerate(in_f):
+            chunk_idx = line_num % num_chunks
+            chunk_files[chunk_idx].write(line)
+            chunk_line_counts[chunk_idx] += 1
+
+    return [chunk_bed_file
+            for chunk_bed_file, line_count in zip(chunk_bed_files, chunk_line_counts)
+            if line_count > 0]
+
+
+def _concatenate_files(in_files: Iterable[Union[Path, str]], out_f: BinaryIO) -> None:
+    """Concatenate files into a single binary stream.
+
+    Data is moved with zero-copy :func:`os.sendfile` where the platform and
+    output stream allow it, falling back to a userspace copy otherwise.
+
+    Args:
+        in_files: Input files, in the order they are to be concatenated.
+        out_f: Writable binary stream to output to.
+
+    """
+    for in_file in in_files:
+        with open(in_file, 'rb') as in_f:
+            offset = 0
             try:
-                chr_size = chr_sizes[region.chrom]
-            except KeyError as e:
-                raise ValueError(f"chromosome ID not found in input file: '{region.chrom}'") from e
+                out_f.flush()  # keep buffered writes ordered before raw fd writes
+                out_fd = out_f.fileno()
+                size = os.fstat(in_f.fileno()).st_size
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                in_f.seek(offset)
+                shutil.copyfileobj(in_f, out_f)
+
+
+def _lift_one_chunk(hal_file: Union[Path, str], src_genome: str, dest_genome: str,
+                    in_bed_file: Union[Path, str], out_psl_file: Union[Path, str],
+                    in_memory: bool = False) -> None:
+    """Lift over the regions of one BED file chunk to PSL.
 
-            if region.start < 0:
-                raise ValueError(f'region start must be greater than or equal to 0: {region.start}')
+    Args:
+        hal_file: Input HAL file.
+        src_genome: Source genome name.
+        dest_genome: Destination genome name.
+        in_bed_file: Input BED file of regions to lift over.
+        out_psl_file: Path of PSL file to output.
+        in_memory: Load the HAL file into memory for the liftover.
 
-            if region.end > chr_size:
-                raise ValueError(f'region end ({region.end}) must not be greater than the'
-                                 f' corresponding chromosome length ({region.chrom}: {chr_size})')
+    Raises:
+        RuntimeError: If halLiftover or pslPosTarget has nonzero exit status.
 
-            flanked_start = max(0, region.start - flank_length)
-            flanked_end = min(region.end + flank_length, chr_size)
+    """
+    # halLiftover --outPSL in.hal GRCh38 in.bed CHM13 stdout | pslPosTarget stdin out.psl
+    cmd1 = ['halLiftover', '--outPSL', hal_file, src_genome, in_bed_file,
+            dest_genome, 'stdout']
+    if in_memory:
+        cmd1.insert(1, '--inMemory')
+    cmd2 = ['pslPosTarget', 'stdin', out_psl_file]
+    with Popen(cmd1, stdout=PIPE, bufsize=PIPE_BUFFER_SIZE) as p1:
+        _enlarge_pipe_buffer(p1.stdout)  # type: ignore[arg-type]
+        with Popen(cmd2, stdin=p1.stdout, bufsize=PIPE_BUFFER_SIZE) as p2:
+            p2.wait()
+            _check_process_status('pslPosTarget', p2.returncode)
+        p1.wait()
+        _check_process_status('halLiftover', p1.returncode)
+
+
+def _make_axt_chain_cmd(in_psl_file: Union[Path, str], src_2bit_file: Union[Path, str],
+                        dest_2bit_file: Union[Path, str], out_chain_file: Union[Path, str],
+                        linear_gap: str) -> List[Union[Path, str]]:
+    """Make an axtChain command chaining the given PSL input.
+
+    Args:
+        in_psl_file: Input PSL file; may be 'stdin' to read from standard input.
+        src_2bit_file: 2bit file of the liftover source (i.e. query) genome.
+        dest_2bit_file: 2bit file of the liftover destination (i.e. target) genome.
+        out_chain_file: Path of chain file to output.
+        linear_gap: axtChain linear gap cost schedule ('loose' or 'medium').
+
+    Returns:
+        The axtChain command, as a list of arguments.
+
+    """
+    return ['axtChain', '-psl', f'-linearGap={linear_gap}', in_psl_file,
+            dest_2bit_file, src_2bit_file, out_chain_file]
+
+
+def run_liftover_and_chain(hal_file: Union[Path, str], src_genome: str, dest_genome: str,
+                           write_src_regions: Callable[[TextIO], None],
+                           out_chain_file: Union[Path, str],
+                           src_2bit_file: Union[Path, str], dest_2bit_file: Union[Path, str],
+                           linear_gap: str = 'loose', jobs: int = 1,
+                           in_memory: bool = False) -> None:
+    """Do a HAL liftover of the given regions and chain the resulting alignments.
+
+    With a single job, halLiftover, pslPosTarget and axtChain run as one
+    streaming pipeline, the query BED is written straight into halLiftover's
+    standard input, and nothing but the output chain file touches the
+    filesystem. When `jobs` is greater than 1, the query BED is written to a
+    temporary file and split into chunks which are lifted over by concurrent
+    halLiftover processes, and the resulting PSL fragments are streamed into
+    a single axtChain process.
+
+    Args:
+        hal_file: Input HAL file.
+        src_genome: Source genome name.
+        dest_genome: Destination genome name.
+        write_src_regions: Callable writing the query BED regions to a given text stream.
+        out_chain_file: Path of chain file to output.
+        src_2bit_file: 2bit file of the source genome.
+        dest_2bit_file: 2bit file of the destination genome.
+        linear_gap: axtChain linear gap cost schedule ('loose' or 'medium').
+        jobs: Maximum number of concurrent halLiftover processes.
+        in_memory: Load the HAL file into memory for the liftover.
+
+    Raises:
+        ValueError: If `jobs` is less than 1.
+
+    """
+    if jobs < 1:
+        raise ValueError(f"'jobs' must be greater than or equal to 1: {jobs}")
+
+    if jobs == 1:
+        # halLiftover --outPSL in.hal GRCh38 /dev/stdin CHM13 stdout | pslPosTarget stdin stdout
+        #   | axtChain -psl -linearGap=loose stdin dest.2bit src.2bit out.chain
+        cmd1 = ['halLiftover', '--outPSL', hal_file, src_genome, '/dev/stdin',
+                dest_genome, 'stdout']
+        if in_memory:
+            cmd1.insert(1, '--inMemory')
+        cmd2 = ['pslPosTarget', 'stdin', 'stdout']
+        cmd3 = _make_axt_chain_cmd('stdin', src_2bit_file, dest_2bit_file,
+                                   out_chain_file, linear_gap)
+        bed_writer_errors: List[BaseException] = []
+        with Popen(cmd1, stdin=PIPE, stdout=PIPE, bufsize=PIPE_BUFFER_SIZE) as p1:
+            _enlarge_pipe_buffer(p1.stdout)  # type: ignore[arg-type]
+            bed_writer = threading.Thread(
+                target=_feed_src_regions,
+                args=(write_src_regions, p1.stdin, bed_writer_errors),
+                daemon=True)
+            bed_writer.start()
+            with Popen(cmd2, stdin=p1.stdout, stdout=PIPE, bufsize=PIPE_BUFFER_SIZE) as p2:
+                p1.stdout.close()  # type: ignore[union-attr]
+                _enlarge_pipe_buffer(p2.stdout)  # type: ignore[arg-type]
+                with Popen(cmd3, stdin=p2.stdout, bufsize=PIPE_BUFFER_SIZE) as p3:
+                    p2.stdout.close()  # type: ignore[union-attr]
+                    p3.wait()
+                    _check_process_status('axtChain', p3.returncode)
+                p2.wait()
+                _check_process_status('pslPosTarget', p2.returncode)
+            p1.wait()
+            _check_process_status('halLiftover', p1.returncode)
+        bed_writer.join()
+        if bed_writer_errors:
+            raise bed_writer_errors[0]
+        return
 
-            fields = [region.chrom, flanked_start, flanked_end, name, score, region.strand]
-            print('\t'.join(str(x) for x in fields), file=f)
+    with TemporaryDirectory() as tmp_dir:
+        in_bed_file = os.path.join(tmp_dir, 'src_regions.bed')
+        with open(in_bed_file, 'w') as bed_f:
+            write_src_regions(bed_f)
+
+        chunk_bed_files = _split_bed(in_bed_file, jobs, tmp_dir)
+        chunk_psl_files = [chunk_bed_file.replace('.bed', '.psl')
+                           for chunk_bed_file in chunk_bed_files]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(_lift_one_chunk, repeat(hal_file), repeat(src_genome),
+                                   repeat(dest_genome), chunk_bed_files, chunk_psl_files,
+                                   repeat(in_memory))
+            for _ in results:  # surface any worker exception
+                pass
+
+        cmd = _make_axt_chain_cmd('stdin', src_2bit_file, dest_2bit_file,
+                                  out_chain_file, linear_gap)
+        with Popen(cmd, stdin=PIPE, bufsize=PIPE_BUFFER_SIZE) as process:
+            _enlarge_pipe_buffer(process.stdin)  # type: ignore[arg-type]
+            _concatenate_files(chunk_psl_files, process.stdin)  # type: ignore[arg-type]
+            process.stdin.close()  # type: ignore[union-attr]
+            process.wait()
+            _check_process_status('axtChain', process.returncode)
 
 
 def parse_region(region: str) -> SimpleRegion:
@@ -128,29 +623,23 @@ def parse_region(region: str) -> SimpleRegion:
         ValueError: If `region` is an invalid region string.
 
     """
-    seq_region_regex = re.compile(
-        r'^(?P<chr>[^:]+):(?P<start>[0-9]+)-(?P<end>[0-9]+):(?P<strand>.+)$'
-    )
-    match = seq_region_regex.match(region)
-
     try:
-        region_chr = match['chr']  # type: ignore
-        match_start = int(match['start'])  # type: ignore
-        region_end = int(match['end'])  # type: ignore
-        match_strand = match['strand']  # type: ignore
-    except TypeError as e:
+        chr_and_coords, match_strand = region.rsplit(':', 1)
+        region_chr, coords = chr_and_coords.rsplit(':', 1)
+        start_str, end_str = coords.split('-', 1)
+        match_start = int(start_str)
+        region_end = int(end_str)
+    except ValueError as e:
         raise ValueError(f"region '{region}' could not be parsed") from e
 
     if match_start < 1:
         raise ValueError(f'region start must be greater than or equal to 1: {match_start}')
     region_start = match_start - 1
 
-    if match_strand == '1':
-        region_strand = '+'
-    elif match_strand == '-1':
-        region_strand = '-'
-    else:
-        raise ValueError(f"region '{region}' has invalid strand: '{match_strand}'")
+    try:
+        region_strand = _STRAND_SYMBOLS[match_strand]
+    except KeyError as e:
+        raise ValueError(f"region '{region}' has invalid strand: '{match_strand}'") from e
 
     if region_start >= region_end:
         raise ValueError(f"region '{region}' has inverted/empty interval")
@@ -164,45 +653,62 @@ if __name__ == '__main__':
     parser.add_argument('hal_file', help="Input HAL file.")
     parser.add_argument('src_genome', help="Source genome name.")
     parser.add_argument('dest_genome', help="Destination genome name.")
-    parser.add_argument('output_file', help="Output file.")
+    parser.add_argument('output_file', help="Output chain file.")
 
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument('--src-region', help="Region to liftover.")
+    group.add_argument('--src-region', action='append',
+                       help="Region to liftover. May be specified multiple times; all"
+                            " regions are lifted over in a single halLiftover call.")
     group.add_argument('--src-bed-file', help="BED file containing regions to liftover.")
 
     parser.add_argument('--flank', default=0, type=int,
                         help="Requested length of upstream/downstream"
                              " flanking regions to include in query.")
 
-    args = parser.parse_args()
+    parser.add_argument('--jobs', default=os.cpu_count() or 1, type=int,
+                        help="Maximum number of concurrent halLiftover processes."
+                             " By default, one per available CPU.")
 
+    parser.add_argument('--in-memory', action='store_true',
+                        help="Load the HAL file into memory for the liftover, avoiding"
+                             " repeated random HDF5 reads. Requires enough RAM to hold"
+                             " the HAL file, which can be tens of gigabytes.")
 
-    with TemporaryDirectory() as tmp_dir:
+    parser.add_argument('--hal-aux-dir',
+                        help="Directory in which 2bit files exported from the HAL file"
+                             " are cached across runs. By default, 2bit files are"
+                             " exported to a temporary directory and discarded on exit.")
 
-        query_bed_file = os.path.join(tmp_dir, 'src_regions.bed')
+    parser.add_argument('--linear-gap', default='loose', choices=['loose', 'medium'],
+                        help="axtChain linear gap cost schedule. Use 'medium' for closely"
+                             " related genomes (e.g. human vs chimp), 'loose' otherwise.")
+
+    args = parser.parse_args()
+
+
+    with TemporaryDirectory() as tmp_dirname:
 
         if args.src_region is not None:
-            src_regions = [parse_region(args.src_region)]
+            src_regions = [parse_region(region) for region in args.src_region]
         else:  # i.e. bed_file is not None
             src_regions = pybedtools.BedTool(args.src_bed_file)
 
-        src_chr_sizes = load_chr_sizes(args.hal_file, args.src_genome)
+        hal_aux_dir = args.hal_aux_dir if args.hal_aux_dir is not None else tmp_dirname
+        os.makedirs(hal_aux_dir, exist_ok=True)
 
-        make_src_region_file(src_regions, src_chr_sizes, query_bed_file, flank_length=args.flank)
+        # The exports run in concurrent child processes, so any missing
+        # 2bit files are generated in parallel rather than one after the other.
+        with ThreadPoolExecutor(max_workers=2) as thread_pool:
+            src_2bit, dest_2bit = thread_pool.map(
+                lambda genome_name: fetch_2bit_file(args.hal_file, genome_name, hal_aux_dir),
+                [args.src_genome, args.dest_genome])
 
-        # halLiftover --outPSL in.hal GRCh38 in.bed CHM13 stdout | pslPosTarget stdin out.psl
-        cmd1 = ['halLiftover', '--outPSL', args.hal_file, args.src_genome, query_bed_file,
-                args.dest_genome, 'stdout']
-        cmd2 = ['pslPosTarget', 'stdin', args.output_file]
-        with Popen(cmd1, stdout=PIPE) as p1:
-            with Popen(cmd2, stdin=p1.stdout) as p2:
-                p2.wait()
-                if p2.returncode != 0:
-                    status_type = 'exit code' if p2.returncode > 0 else 'signal'
-                    raise RuntimeError(
-                        f'pslPosTarget terminated with {status_type} {abs(p2.returncode)}')
-            p1.wait()
-            if p1.returncode != 0:
-                status_type = 'exit code' if p1.returncode > 0 else 'signal'
-                raise RuntimeError(
-                    f'halLiftover terminated with {status_type} {abs(p1.returncode)}')
+        src_chr_sizes = load_chrom_sizes(src_2bit)
+
+        src_region_writer = partial(make_src_region_file, src_regions, src_chr_sizes,
+                                    flank_length=args.flank)
+
+        run_liftover_and_chain(args.hal_file, args.src_genome, args.dest_genome,
+                               src_region_writer, args.output_file, src_2bit,
+                               dest_2bit, linear_gap=args.linear_gap,
+                               jobs=args.jobs, in_memory=args.in_memory)
@@ -24,10 +24,13 @@ import filecmp
 from importlib.abc import Loader
 from importlib.machinery import ModuleSpec
 from importlib.util import module_from_spec, spec_from_file_location
+import io
+import json
+import os
 from pathlib import Path
 import sys
 from types import ModuleType
-from typing import ContextManager, Iterable, Mapping, Union
+from typing import ContextManager, Iterable, List, Mapping, Union
 
 import pytest
 from pytest import raises
@@ -161,3 +164,108 @@ class TestHalGeneLiftover:
             hal_gene_liftover.make_src_region_file(regions, chr_sizes, out_file_path, flank_length)
             ref_file_path = self.ref_file_dir / bed_file
             assert filecmp.cmp(out_file_path, ref_file_path)
+
+    @pytest.mark.parametrize(
+        "num_lines, num_chunks, exp_distribution",
+        [
+            (6, 3, [2, 2, 2]),
+            (5, 2, [3, 2]),
+            (2, 4, [1, 1]),
+            (0, 2, [])
+        ]
+    )
+    def test_split_bed(self, num_lines: int, num_chunks: int, exp_distribution: List[int],
+                       tmp_dir: Path) -> None:
+        """Tests :func:`hal_gene_liftover._split_bed()` function.
+
+        Args:
+            num_lines: Number of lines in the input BED file.
+            num_chunks: Maximum number of chunks to create.
+            exp_distribution: Expected number of lines per created chunk BED file.
+            tmp_dir: Unit test temp directory (fixture).
+
+        """
+        chunk_dir = tmp_dir / f'split_bed.{num_lines}_lines.{num_chunks}_chunks'
+        chunk_dir.mkdir()
+        in_lines = [f'chr1\t{i}\t{i + 1}\t.\t0\t+\n' for i in range(num_lines)]
+        in_bed_file = chunk_dir / 'in.bed'
+        in_bed_file.write_text(''.join(in_lines))
+        # pylint: disable-next=protected-access
+        chunk_bed_files = hal_gene_liftover._split_bed(in_bed_file, num_chunks, chunk_dir)
+        assert len(chunk_bed_files) == len(exp_distribution)
+        for chunk_idx, (chunk_bed_file, exp_line_count) in enumerate(zip(chunk_bed_files,
+                                                                         exp_distribution)):
+            with open(chunk_bed_file) as chunk_file_obj:
+                chunk_lines = chunk_file_obj.readlines()
+            assert len(chunk_lines) == exp_line_count
+            assert chunk_lines == in_lines[chunk_idx::num_chunks]
+
+    def test_concatenate_files(self, tmp_dir: Path) -> None:
+        """Tests :func:`hal_gene_liftover._concatenate_files()` function.
+
+        Args:
+            tmp_dir: Unit test temp directory (fixture).
+
+        """
+        cat_dir = tmp_dir / 'concatenate_files'
+        cat_dir.mkdir()
+        in_file_paths = [cat_dir / 'a.psl', cat_dir / 'b.psl']
+        in_file_paths[0].write_bytes(b'alpha\n')
+        in_file_paths[1].write_bytes(b'beta\n')
+
+        out_file_path = cat_dir / 'cat.psl'
+        with open(out_file_path, 'wb') as out_file_obj:
+            # pylint: disable-next=protected-access
+            hal_gene_liftover._concatenate_files(in_file_paths, out_file_obj)
+        assert out_file_path.read_bytes() == b'alpha\nbeta\n'
+
+        # An in-memory stream has no file descriptor,
+        # so this exercises the userspace copy fallback.
+        out_stream = io.BytesIO()
+        # pylint: disable-next=protected-access
+        hal_gene_liftover._concatenate_files(in_file_paths, out_stream)
+        assert out_stream.getvalue() == b'alpha\nbeta\n'
+
+    def test_load_chrom_sizes_cache(self, tmp_dir: Path,
+                                    monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tests the JSON sizes cache of :func:`hal_gene_liftover.load_chrom_sizes()`.
+
+        Args:
+            tmp_dir: Unit test temp directory (fixture).
+            monkeypatch: Monkeypatching fixture.
+
+        """
+        cache_dir = tmp_dir / 'chrom_sizes_cache'
+        cache_dir.mkdir()
+        two_bit_file = cache_dir / 'genome.2bit'
+        two_bit_file.write_bytes(b'')
+        sizes_file = cache_dir / 'genome.2bit.sizes.json'
+        monkeypatch.setattr(hal_gene_liftover, '_read_chrom_sizes', lambda _: {'chr1': 33})
+
+        # With no cache file, the sizes are read from the 2bit file and cached.
+        assert hal_gene_liftover.load_chrom_sizes(two_bit_file) == {'chr1': 33}
+        assert json.loads(sizes_file.read_text()) == {'chr1': 33}
+
+        # A fresh cache file is used instead of reading the 2bit file.
+        sizes_file.write_text('{"chr1": 42}')
+        assert hal_gene_liftover.load_chrom_sizes(two_bit_file) == {'chr1': 42}
+
+        # A cache file older than the 2bit file is stale, and is refreshed.
+        stale_mtime = os.stat(two_bit_file).st_mtime - 60
+        os.utime(sizes_file, times=(stale_mtime, stale_mtime))
+        assert hal_gene_liftover.load_chrom_sizes(two_bit_file) == {'chr1': 33}
+        assert json.loads(sizes_file.read_text()) == {'chr1': 33}
+
+    def test_make_src_region_file_to_stream(self, tmp_dir: Path) -> None:
+        """Tests :func:`hal_gene_liftover.make_src_region_file()` writing to a text stream.
+
+        Args:
+            tmp_dir: Unit test temp directory (fixture).
+
+        """
+        out_file_path = tmp_dir / 'a2b.one2one.plus.flank0.stream.src.bed'
+        with open(out_file_path, 'w') as out_file_obj:
+            hal_gene_liftover.make_src_region_file([SimpleRegion('chr1', 15, 18, '+')],
+                                                   {'chr1': 33}, out_file_obj, 0)
+        ref_file_path = self.ref_file_dir / 'a2b.one2one.plus.flank0.src.bed'
+        assert filecmp.cmp(out_file_path, ref_file_path)